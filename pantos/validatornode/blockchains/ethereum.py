@@ -1,15 +1,28 @@
 """Module for Ethereum-specific clients and errors.
 
 """
+import collections.abc
+import concurrent.futures
+import dataclasses
+import functools
 import json
 import logging
-import re
+import string
 import typing
-import urllib.parse
 import uuid
 
+import eth_abi
+import eth_abi.packed
+import eth_account._utils.signing
 import eth_account.messages
+import eth_hash.auto
+import eth_keys
+import eth_utils.abi
+import hexbytes
 import web3
+import web3._utils.events
+import web3._utils.method_formatters
+import web3._utils.request
 import web3.contract.contract
 import web3.exceptions
 import web3.providers.rpc
@@ -33,17 +46,72 @@ from pantos.validatornode.entities import CrossChainTransfer
 _HUB_TRANSFER_TO_FUNCTION_SELECTOR = '0x92557c8a'
 _HUB_TRANSFER_TO_GAS = 250000
 
+_MAX_GET_LOGS_BATCH_SIZE = 50
+_JSON_RPC_INVALID_REQUEST_ERROR_CODE = -32600
+_MAX_CONCURRENT_NODE_REQUESTS = 10
+
+_PRECOMPILED_CONTRACT_FUNCTIONS = [
+    (ContractAbi.PANTOS_FORWARDER, 'getMinimumValidatorNodeSignatures'),
+    (ContractAbi.PANTOS_FORWARDER, 'getValidatorNodes'),
+    (ContractAbi.PANTOS_HUB, 'getExternalTokenRecord'),
+    (ContractAbi.PANTOS_HUB, 'getTokenRecord'),
+    (ContractAbi.PANTOS_HUB, 'isValidValidatorNodeNonce'),
+    (ContractAbi.PANTOS_HUB, 'verifyTransferTo'),
+    (ContractAbi.PANTOS_TOKEN, 'decimals')
+]
+
 _NON_MATCHING_FORWARDER_ERROR = \
     'PantosHub: Forwarder of Hub and transferred token must match'
 _SOURCE_TRANSFER_ID_ALREADY_USED_ERROR = \
     'PantosHub: source transfer ID already used'
 
-_TRANSACTION_ID_PATTERN = re.compile(r'^0x[a-fA-F0-9]{64}')
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+_ADDRESS_HEX_LENGTH = 40
+_TRANSACTION_ID_LENGTH = 66
+
+_TRANSFER_TO_MESSAGE_TYPES = ('uint256', 'uint256', 'string', 'uint256',
+                              'string', 'address', 'string', 'address',
+                              'uint256', 'uint256', 'address', 'address',
+                              'address')
+
+# eth-keys uses the libsecp256k1 (coincurve) backend whenever it is
+# installed and falls back to its pure-Python implementation otherwise
+_KEY_API = eth_keys.KeyAPI()
 
 _logger = logging.getLogger(__name__)
 
 _OnChainTransferToRequest = tuple[int, int, str, str, str, str, str, int, int]
 
+_MAX_CACHED_CHECKSUM_ADDRESSES = 1024
+
+
+@functools.lru_cache(maxsize=_MAX_CACHED_CHECKSUM_ADDRESSES)
+def _to_checksum_address(address: str) -> BlockchainAddress:
+    # The set of validator node addresses rarely changes, so their
+    # (keccak-based) checksum representations are cached
+    return BlockchainAddress(web3.Web3.to_checksum_address(address))
+
+
+@dataclasses.dataclass
+class _ContractFunctionCodec:
+    """Precomputed data for encoding the calls of a contract function
+    and decoding their results.
+
+    Attributes
+    ----------
+    selector : bytes
+        The 4-byte function selector.
+    input_types : list of str
+        The ABI types of the function parameters.
+    output_types : list of str
+        The ABI types of the function results.
+
+    """
+    selector: bytes
+    input_types: list[str]
+    output_types: list[str]
+
 
 class EthereumClientError(BlockchainClientError):
     """Exception class for all Ethereum client errors.
@@ -61,11 +129,29 @@ class EthereumClient(BlockchainClient):
 
         """
         super().__init__()
-        private_key = self._get_config()['private_key']
-        private_key_password = self._get_config()['private_key_password']
+        config = self._get_config()
+        private_key = config['private_key']
+        private_key_password = config['private_key_password']
         self.__private_key = self.get_utilities().decrypt_private_key(
             private_key, private_key_password)
         self.__address = self.get_utilities().get_address(self.__private_key)
+        self.__contract_function_codecs = {
+            function_name: self.__create_contract_function_codec(
+                contract_abi, function_name)
+            for contract_abi, function_name in _PRECOMPILED_CONTRACT_FUNCTIONS
+        }
+        self.__hub_transfer_from_event_abi = self.__find_abi_element(
+            ContractAbi.PANTOS_HUB, 'event', 'TransferFrom')
+        self.__hub_transfer_from_event_topic = hexbytes.HexBytes(
+            eth_utils.abi.event_abi_to_log_topic(
+                self.__hub_transfer_from_event_abi))
+        self.__batch_requests_unsupported_endpoint_uris = set[str]()
+        # web3 keeps one HTTP session (with its pooled keep-alive
+        # connections) per thread and node endpoint, so concurrent node
+        # requests are always issued from the same long-lived threads
+        self.__executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_MAX_CONCURRENT_NODE_REQUESTS,
+            thread_name_prefix=f'{self.get_blockchain().name.lower()}_client')
 
     @classmethod
     def get_blockchain(cls) -> Blockchain:
@@ -89,9 +175,9 @@ class EthereumClient(BlockchainClient):
         # Docstring inherited
         try:
             node_connections = self.__create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
-            token_record = hub_contract.functions.getTokenRecord(
-                token_address).call().get()
+            token_record = self.__call_contract_function(
+                node_connections,
+                self._get_config()['hub'], 'getTokenRecord', token_address)
             assert len(token_record) == 2
             assert isinstance(token_record[0], bool)
             token_active = token_record[0]
@@ -105,25 +191,31 @@ class EthereumClient(BlockchainClient):
 
     def is_valid_recipient_address(self, recipient_address: str) -> bool:
         # Docstring inherited
-        try:
-            checksum_address = web3.Web3.to_checksum_address(recipient_address)
-        except ValueError:
+        # Only the format is relevant here, so the address is not
+        # converted to its (keccak-based) checksum representation
+        if recipient_address[:2] in ('0x', '0X'):
+            recipient_address = recipient_address[2:]
+        if (len(recipient_address) != _ADDRESS_HEX_LENGTH
+                or not _HEX_DIGITS.issuperset(recipient_address)):
             # No valid address
             return False
-        is_zero_address = int(checksum_address, 0) == 0
+        is_zero_address = int(recipient_address, 16) == 0
         return not is_zero_address
 
     def is_valid_transaction_id(self, transaction_id: str) -> bool:
         # Docstring inherited
-        return (re.fullmatch(_TRANSACTION_ID_PATTERN, transaction_id)
-                is not None)
+        return (len(transaction_id) == _TRANSACTION_ID_LENGTH
+                and transaction_id.startswith('0x')
+                and _HEX_DIGITS.issuperset(transaction_id[2:]))
 
     def is_valid_validator_nonce(self, nonce: int) -> bool:
         # Docstring inherited
         try:
             node_connections = self.__create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
-            return hub_contract.caller().isValidValidatorNodeNonce(nonce).get()
+            return self.__call_contract_function(node_connections,
+                                                 self._get_config()['hub'],
+                                                 'isValidValidatorNodeNonce',
+                                                 nonce)
         except ResultsNotMatchingError:
             raise
         except Exception:
@@ -143,10 +235,10 @@ class EthereumClient(BlockchainClient):
         # Docstring inherited
         try:
             node_connections = self.__create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
-            external_token_record = \
-                hub_contract.functions.getExternalTokenRecord(
-                    token_address, external_blockchain.value).call().get()
+            external_token_record = self.__call_contract_function(
+                node_connections,
+                self._get_config()['hub'], 'getExternalTokenRecord',
+                token_address, external_blockchain.value)
             assert len(external_token_record) == 2
             assert isinstance(external_token_record[0], bool)
             assert isinstance(external_token_record[1], str)
@@ -168,10 +260,10 @@ class EthereumClient(BlockchainClient):
         # Docstring inherited
         try:
             node_connections = self.__create_node_connections()
-            forwarder_contract = self._create_forwarder_contract(
-                node_connections)
-            minimum_signatures = forwarder_contract.caller().\
-                getMinimumValidatorNodeSignatures().get()
+            minimum_signatures = self.__call_contract_function(
+                node_connections,
+                self._get_config()['forwarder'],
+                'getMinimumValidatorNodeSignatures')
             assert minimum_signatures > 0
             return minimum_signatures
         except ResultsNotMatchingError:
@@ -195,25 +287,30 @@ class EthereumClient(BlockchainClient):
                 f'from block {from_block_number} to block '
                 f'{latest_block_number} using node '
                 f'{self.__get_blockchain_nodes_domains(node_connections)}')
-            hub_contract = self._create_hub_contract(node_connections)
+            config = self._get_config()
+            hub_contract = self._create_hub_contract(
+                node_connections, BlockchainAddress(config['hub']))
             event = typing.cast(
                 NodeConnections.Wrapper[web3.contract.contract.ContractEvent],
                 hub_contract.events.TransferFrom())
-            number_blocks = self._get_config(
-            )['outgoing_transfers_number_blocks']
+            number_blocks = config['outgoing_transfers_number_blocks']
             to_block_numbers = list(
                 range(from_block_number + number_blocks, latest_block_number,
                       number_blocks)) + [latest_block_number]
+            block_ranges: list[tuple[int, int]] = []
+            range_from_block_number = from_block_number
+            for to_block_number in to_block_numbers:
+                assert to_block_number >= range_from_block_number
+                block_ranges.append((range_from_block_number, to_block_number))
+                range_from_block_number = to_block_number + 1
             # All TransferFrom events included in blocks between the
             # specified block numbers
-            event_logs: typing.List[web3.types.EventData] = []
-            for to_block_number in to_block_numbers:
-                assert to_block_number >= from_block_number
-                event_logs += self.get_utilities().get_logs(
-                    event, from_block_number, to_block_number)
-                from_block_number = to_block_number + 1
-            outgoing_transfers = self.__create_outgoing_transfers(
-                event_logs, hub_contract.address.get())
+            event_logs = self.__read_event_logs(
+                node_connections, event,
+                self.__hub_transfer_from_event_topic.hex(), block_ranges)
+            outgoing_transfers = list(
+                self.__create_outgoing_transfers(event_logs,
+                                                 hub_contract.address.get()))
             return BlockchainClient.ReadOutgoingTransfersFromBlockResponse(
                 outgoing_transfers, latest_block_number)
         except ResultsNotMatchingError:
@@ -231,13 +328,21 @@ class EthereumClient(BlockchainClient):
             node_connections = self.__create_node_connections()
             transaction_receipt = node_connections.eth.get_transaction_receipt(
                 typing.cast(web3.types.HexStr, transaction_id)).get()
-            assert (
-                transaction_receipt['transactionHash'].hex() == transaction_id)
-            hub_contract = self._create_hub_contract(node_connections,
-                                                     hub_address)
-            event_logs = hub_contract.events.TransferFrom().process_receipt(
-                transaction_receipt, errors=web3.logs.DISCARD).get()
-            return self.__create_outgoing_transfers(event_logs, hub_address)
+            assert (hexbytes.HexBytes(transaction_id) ==
+                    transaction_receipt['transactionHash'])
+            # Only the TransferFrom event logs emitted by the hub are
+            # decoded (instead of trying to decode all receipt logs)
+            codec = node_connections.get_configured_node_connections()[0].codec
+            event_logs = [
+                web3._utils.events.get_event_data(
+                    codec, self.__hub_transfer_from_event_abi, log)
+                for log in transaction_receipt['logs']
+                if len(log['topics']) > 0
+                and log['topics'][0] == self.__hub_transfer_from_event_topic
+                and self.is_equal_address(log['address'], hub_address)
+            ]
+            return list(
+                self.__create_outgoing_transfers(event_logs, hub_address))
         except ResultsNotMatchingError:
             raise
         except Exception:
@@ -249,9 +354,8 @@ class EthereumClient(BlockchainClient):
         # Docstring inherited
         try:
             node_connections = self.__create_node_connections()
-            token_contract = self._create_token_contract(
-                node_connections, token_address)
-            decimals = token_contract.functions.decimals().call().get()
+            decimals = self.__call_contract_function(node_connections,
+                                                     token_address, 'decimals')
             assert isinstance(decimals, int)
             return decimals
         except ResultsNotMatchingError:
@@ -264,12 +368,11 @@ class EthereumClient(BlockchainClient):
         # Docstring inherited
         try:
             node_connections = self.__create_node_connections()
-            forwarder_contract = self._create_forwarder_contract(
-                node_connections)
-            validator_node_addresses = \
-                forwarder_contract.caller().getValidatorNodes().get()
+            validator_node_addresses = self.__call_contract_function(
+                node_connections,
+                self._get_config()['forwarder'], 'getValidatorNodes')
             return [
-                BlockchainAddress(validator_node_address)
+                _to_checksum_address(validator_node_address)
                 for validator_node_address in validator_node_addresses
             ]
         except ResultsNotMatchingError:
@@ -284,9 +387,10 @@ class EthereumClient(BlockchainClient):
             -> BlockchainAddress:
         # Docstring inherited
         destination_blockchain = self.get_blockchain()
-        hub_address = self._get_config()['hub']
-        forwarder_address = self._get_config()['forwarder']
-        pan_token_address = self._get_config()['pan_token']
+        config = self._get_config()
+        hub_address = config['hub']
+        forwarder_address = config['forwarder']
+        pan_token_address = config['pan_token']
         message = self.__create_transfer_to_message(
             request.source_blockchain, destination_blockchain,
             request.source_transaction_id, request.source_transfer_id,
@@ -295,8 +399,8 @@ class EthereumClient(BlockchainClient):
             request.amount, request.validator_nonce, hub_address,
             forwarder_address, pan_token_address)
         try:
-            signer_address = web3.Account.recover_message(
-                message, signature=request.signature)
+            signer_address = self.__recover_signer_address(
+                message, request.signature)
         except Exception:
             raise self._create_error('unable to recover the signer\'s address',
                                      request=request)
@@ -312,10 +416,11 @@ class EthereumClient(BlockchainClient):
                 'eventual destination blockchain of incoming transfer must be '
                 f'{self.get_blockchain_name()}', request=request)
         try:
-            assert request.destination_hub_address == self._get_config()['hub']
-            assert (request.destination_forwarder_address ==
-                    self._get_config()['forwarder'])
-            pan_token_address = self._get_config()['pan_token']
+            config = self._get_config()
+            assert request.destination_hub_address == config['hub']
+            assert (
+                request.destination_forwarder_address == config['forwarder'])
+            pan_token_address = config['pan_token']
             message = self.__create_transfer_to_message(
                 request.incoming_transfer.source_blockchain,
                 request.incoming_transfer.eventual_destination_blockchain,
@@ -346,7 +451,6 @@ class EthereumClient(BlockchainClient):
                 f'{self.get_blockchain_name()}', request=request)
         try:
             node_connections = self.__create_node_connections()
-            hub_contract = self._create_hub_contract(node_connections)
             on_chain_request: _OnChainTransferToRequest = (
                 request.incoming_transfer.source_blockchain.value,
                 request.incoming_transfer.source_transfer_id,
@@ -359,14 +463,31 @@ class EthereumClient(BlockchainClient):
             sorted_signer_addresses, sorted_signatures = \
                 self.__sort_validator_node_signatures(
                     request.validator_node_signatures)
-            self.__verify_transfer_to_request(hub_contract,
-                                              request.incoming_transfer,
-                                              on_chain_request,
-                                              sorted_signer_addresses,
-                                              sorted_signatures)
+            # The signatures are decoded only once for both the
+            # verification and the submission
+            sorted_signature_bytes: list[bytes] = [
+                hexbytes.HexBytes(signature) for signature in sorted_signatures
+            ]
+            # Without the verification, an invalid transferTo request is
+            # only detected when its submitted transaction is reverted
+            if self._get_config()['skip_pre_verify']:
+                transaction_count = self.__read_transaction_count(
+                    node_connections)
+            else:
+                # The transaction count is independent of the transferTo
+                # verification, so both are requested concurrently
+                transaction_count_future = self.__executor.submit(
+                    self.__read_transaction_count, node_connections)
+                self.__verify_transfer_to_request(node_connections,
+                                                  request.incoming_transfer,
+                                                  on_chain_request,
+                                                  sorted_signer_addresses,
+                                                  sorted_signature_bytes)
+                transaction_count = transaction_count_future.result()
             internal_transaction_id = self.__submit_transfer_to_request(
                 node_connections, request.internal_transfer_id,
-                on_chain_request, sorted_signer_addresses, sorted_signatures)
+                transaction_count, on_chain_request, sorted_signer_addresses,
+                sorted_signature_bytes)
             return internal_transaction_id
         except ResultsNotMatchingError:
             raise
@@ -376,15 +497,6 @@ class EthereumClient(BlockchainClient):
             raise self._create_error('unable to start a transferTo submission',
                                      request=request)
 
-    def _create_forwarder_contract(
-            self, node_connections: NodeConnections) \
-            -> NodeConnections.Wrapper[web3.contract.Contract]:
-        forwarder_address = BlockchainAddress(self._get_config()['forwarder'])
-        return self.get_utilities().create_contract(
-            forwarder_address,
-            VERSIONED_CONTRACTS_ABI[ContractAbi.PANTOS_FORWARDER],
-            node_connections)
-
     def _create_hub_contract(
             self, node_connections: NodeConnections,
             hub_address: typing.Optional[BlockchainAddress] = None) \
@@ -395,14 +507,6 @@ class EthereumClient(BlockchainClient):
             hub_address, VERSIONED_CONTRACTS_ABI[ContractAbi.PANTOS_HUB],
             node_connections)
 
-    def _create_token_contract(
-            self, node_connections: NodeConnections,
-            token_address: BlockchainAddress) \
-            -> NodeConnections.Wrapper[web3.contract.Contract]:
-        return self.get_utilities().create_contract(
-            token_address, VERSIONED_CONTRACTS_ABI[ContractAbi.PANTOS_TOKEN],
-            node_connections)
-
     def _read_transfer_to_transaction_data(
             self, transaction_id: str, read_destination_transfer_id: bool) \
             -> BlockchainClient._TransferToTransactionDataResponse:
@@ -410,8 +514,10 @@ class EthereumClient(BlockchainClient):
             node_connections = self.__create_node_connections()
             transaction_receipt = node_connections.eth.get_transaction_receipt(
                 typing.cast(web3.types.HexStr, transaction_id)).get()
-            _logger.info('transferTo transaction receipt', extra=json.loads(
-                web3.Web3.to_json(transaction_receipt)))  # type: ignore
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info(
+                    'transferTo transaction receipt',
+                    extra=self.__to_loggable_value(transaction_receipt))
             block_number = transaction_receipt['blockNumber']
             destination_transfer_id = None
             if read_destination_transfer_id:
@@ -430,10 +536,37 @@ class EthereumClient(BlockchainClient):
                 transaction_id=transaction_id,
                 read_destination_transfer_id=read_destination_transfer_id)
 
+    def __call_contract_function(self, node_connections: NodeConnections,
+                                 contract_address: BlockchainAddress,
+                                 function_name: str, *args:
+                                 typing.Any) -> typing.Any:
+        codec = self.__contract_function_codecs[function_name]
+        call_data = codec.selector + eth_abi.encode(codec.input_types, args)
+        return_data = node_connections.eth.call({
+            'to': contract_address,
+            'data': web3.Web3.to_hex(call_data)
+        }).get()
+        results = eth_abi.decode(codec.output_types, return_data)
+        return results[0] if len(results) == 1 else results
+
+    def __create_contract_function_codec(
+            self, contract_abi: ContractAbi,
+            function_name: str) -> _ContractFunctionCodec:
+        function_abi = self.__find_abi_element(contract_abi, 'function',
+                                               function_name)
+        return _ContractFunctionCodec(
+            eth_utils.abi.function_abi_to_4byte_selector(function_abi), [
+                eth_utils.abi.collapse_if_tuple(input_)
+                for input_ in function_abi['inputs']
+            ], [
+                eth_utils.abi.collapse_if_tuple(output)
+                for output in function_abi['outputs']
+            ])
+
     def __create_outgoing_transfers(
             self, event_logs: typing.Iterable[web3.types.EventData],
-            hub_contract_address: str) -> typing.List[CrossChainTransfer]:
-        outgoing_transfers: typing.List[CrossChainTransfer] = []
+            hub_contract_address: str) -> typing.Iterator[CrossChainTransfer]:
+        source_blockchain = self.get_blockchain()
         for event_log in event_logs:
             assert event_log['event'] == 'TransferFrom'
             # TransferFrom event arguments
@@ -447,26 +580,14 @@ class EthereumClient(BlockchainClient):
             amount = event_args['amount']
             fee = event_args['fee']
             service_node_address = event_args['serviceNode']
-            assert isinstance(source_transfer_id, int)
-            assert isinstance(destination_blockchain_id, int)
-            assert isinstance(sender_address, str)
-            assert isinstance(recipient_address, str)
-            assert isinstance(source_token_address, str)
-            assert isinstance(destination_token_address, str)
-            assert isinstance(amount, int)
-            assert isinstance(fee, int)
-            assert isinstance(service_node_address, str)
-            # Transaction and block data
+            # Transaction and block data (the argument types are
+            # already guaranteed by the ABI-based event decoding)
             transaction_hash = event_log['transactionHash'].hex()
             block_number = event_log['blockNumber']
             block_hash = event_log['blockHash'].hex()
-            assert isinstance(transaction_hash, str)
-            assert isinstance(block_number, int)
-            assert isinstance(block_hash, str)
-            source_blockchain = self.get_blockchain()
             destination_blockchain = Blockchain(destination_blockchain_id)
             assert source_blockchain != destination_blockchain
-            outgoing_transfer = CrossChainTransfer(
+            yield CrossChainTransfer(
                 source_blockchain, destination_blockchain,
                 BlockchainAddress(hub_contract_address), source_transfer_id,
                 transaction_hash, block_number, block_hash,
@@ -475,8 +596,6 @@ class EthereumClient(BlockchainClient):
                 BlockchainAddress(source_token_address),
                 BlockchainAddress(destination_token_address), amount, fee,
                 BlockchainAddress(service_node_address))
-            outgoing_transfers.append(outgoing_transfer)
-        return outgoing_transfers
 
     def __create_transfer_to_message(
             self, source_blockchain: Blockchain,
@@ -487,23 +606,36 @@ class EthereumClient(BlockchainClient):
             destination_token_address: BlockchainAddress, amount: int,
             validator_nonce: int, hub_address: str, forwarder_address: str,
             pan_token_address: str) -> eth_account.messages.SignableMessage:
-        base_message = web3.Web3.solidity_keccak([
-            'uint256', 'uint256', 'string', 'uint256', 'string', 'address',
-            'string', 'address', 'uint256', 'uint256', 'address', 'address',
-            'address'
-        ], [
-            source_blockchain.value, destination_blockchain.value,
-            source_transaction_id, source_transfer_id, sender_address,
-            recipient_address, source_token_address, destination_token_address,
-            amount, validator_nonce, hub_address, forwarder_address,
-            pan_token_address
-        ])
+        # The packed encoding accepts all-lowercase and all-uppercase
+        # addresses, but (as with web3's solidity_keccak) only checksum
+        # addresses are valid
+        for address in (recipient_address, destination_token_address,
+                        hub_address, forwarder_address, pan_token_address):
+            if not web3.Web3.is_checksum_address(address):
+                raise web3.exceptions.InvalidAddress(
+                    f'address must be a checksum address: {address}')
+        base_message = eth_hash.auto.keccak(
+            eth_abi.packed.encode_packed(_TRANSFER_TO_MESSAGE_TYPES, [
+                source_blockchain.value, destination_blockchain.value,
+                source_transaction_id, source_transfer_id, sender_address,
+                recipient_address, source_token_address,
+                destination_token_address, amount, validator_nonce,
+                hub_address, forwarder_address, pan_token_address
+            ]))
         return eth_account.messages.encode_defunct(base_message)
 
     def __create_node_connections(self) -> NodeConnections:
         provider_timeout = self._get_config()['provider_timeout']
         return self.get_utilities().create_node_connections(provider_timeout)
 
+    def __find_abi_element(self, contract_abi: ContractAbi, abi_type: str,
+                           name: str) -> dict[str, typing.Any]:
+        loaded_contract_abi = self.get_utilities().load_contract_abi(
+            VERSIONED_CONTRACTS_ABI[contract_abi])
+        return next(
+            abi_element for abi_element in loaded_contract_abi
+            if abi_element['type'] == abi_type and abi_element['name'] == name)
+
     def __get_blockchain_nodes_domains(
             self, node_connections: NodeConnections) -> str:
         blockchain_nodes_domains: list[str] = []
@@ -513,16 +645,61 @@ class EthereumClient(BlockchainClient):
             if not isinstance(node_connection.provider,
                               web3.providers.rpc.HTTPProvider):
                 continue
-            blockchain_node_domain = urllib.parse.urlparse(
-                node_connection.provider.endpoint_uri).netloc
-            assert isinstance(blockchain_node_domain, str)
+            endpoint_uri = str(node_connection.provider.endpoint_uri)
+            blockchain_node_domain = endpoint_uri.partition('://')[2]
+            # The authority ends with the path, query, or fragment
+            # (which may contain secrets such as API keys)
+            for delimiter in '/?#':
+                blockchain_node_domain = blockchain_node_domain.partition(
+                    delimiter)[0]
             blockchain_nodes_domains.append(blockchain_node_domain)
         return ', '.join(blockchain_nodes_domains)
 
-    def __get_nonce(self, node_connections: NodeConnections,
-                    internal_transfer_id: int) -> int:
-        transaction_count = node_connections.eth.get_transaction_count(
-            self.__address).get_maximum_result()
+    def __get_logs_batched(
+            self, node_connection: web3.Web3,
+            filter_params: list[dict[str, typing.Any]]) \
+            -> typing.Optional[list[web3.types.LogReceipt]]:
+        provider = typing.cast(web3.providers.rpc.HTTPProvider,
+                               node_connection.provider)
+        assert provider.endpoint_uri is not None
+        batch_request = [{
+            'jsonrpc': '2.0',
+            'method': 'eth_getLogs',
+            'params': [params],
+            'id': request_id
+        } for request_id, params in enumerate(filter_params)]
+        raw_response = web3._utils.request.make_post_request(
+            provider.endpoint_uri,
+            json.dumps(batch_request).encode(),
+            **provider.get_request_kwargs())
+        responses = json.loads(raw_response)
+        # Nodes not supporting batch requests reject the batch as a
+        # whole or each of its requests as an invalid request
+        if not isinstance(responses, list) or any(
+                response.get('error', {}).get('code') ==
+                _JSON_RPC_INVALID_REQUEST_ERROR_CODE
+                for response in responses):
+            self.__batch_requests_unsupported_endpoint_uris.add(
+                str(provider.endpoint_uri))
+            _logger.warning(
+                'batch requests not supported by a node on '
+                f'{self.get_blockchain_name()}, falling back to single '
+                f'requests for that node: {responses}')
+            return None
+        assert len(responses) == len(batch_request)
+        responses.sort(key=lambda response: response['id'])
+        logs: list[web3.types.LogReceipt] = []
+        for response in responses:
+            if 'error' in response:
+                raise ValueError(f'batch request error: {response["error"]}')
+            logs += [
+                web3._utils.method_formatters.log_entry_formatter(raw_log)
+                for raw_log in response['result']
+            ]
+        return logs
+
+    def __get_nonce(self, internal_transfer_id: int,
+                    transaction_count: int) -> int:
         database_access.update_transfer_nonce(internal_transfer_id,
                                               self.get_blockchain(),
                                               transaction_count)
@@ -530,6 +707,103 @@ class EthereumClient(BlockchainClient):
         assert nonce is not None
         return nonce
 
+    def __read_event_logs(
+            self, node_connections: NodeConnections,
+            event: NodeConnections.Wrapper[
+                web3.contract.contract.ContractEvent], event_topic: str,
+            block_ranges: list[tuple[int, int]]) \
+            -> list[web3.types.EventData]:
+        configured_node_connections: list[web3.Web3] = \
+            node_connections.get_configured_node_connections()
+        if len(block_ranges) > 1 and all(
+                isinstance(node_connection.provider,
+                           web3.providers.rpc.HTTPProvider)
+                and str(node_connection.provider.endpoint_uri) not in
+                self.__batch_requests_unsupported_endpoint_uris
+                for node_connection in configured_node_connections):
+            batched_event_logs = self.__read_event_logs_batched(
+                configured_node_connections, event, event_topic, block_ranges)
+            if batched_event_logs is not None:
+                return batched_event_logs
+        if len(block_ranges) == 1:
+            return self.get_utilities().get_logs(event, *block_ranges[0])
+        # The block ranges are independent of each other, so their
+        # event logs are requested concurrently
+        block_ranges_event_logs = self.__executor.map(
+            lambda block_range: self.get_utilities().get_logs(
+                event, *block_range), block_ranges)
+        event_logs: list[web3.types.EventData] = []
+        for block_range_event_logs in block_ranges_event_logs:
+            event_logs += block_range_event_logs
+        return event_logs
+
+    def __read_event_logs_batched(
+            self, configured_node_connections: list[web3.Web3],
+            event: NodeConnections.Wrapper[
+                web3.contract.contract.ContractEvent], event_topic: str,
+            block_ranges: list[tuple[int, int]]) \
+            -> typing.Optional[list[web3.types.EventData]]:
+        event_abi = event.abi.get()
+        contract_address = event.address.get()
+        filter_params = [{
+            'address': contract_address,
+            'topics': [event_topic],
+            'fromBlock': hex(from_block_number),
+            'toBlock': hex(to_block_number)
+        } for from_block_number, to_block_number in block_ranges]
+        # Each node must return the same event logs (as with the
+        # non-batched requests handled by the node connections)
+        results: list[list[web3.types.EventData]] = []
+        for node_connection in configured_node_connections:
+            event_logs: list[web3.types.EventData] = []
+            try:
+                for batch_start in range(0, len(filter_params),
+                                         _MAX_GET_LOGS_BATCH_SIZE):
+                    raw_event_logs = self.__get_logs_batched(
+                        node_connection,
+                        filter_params[batch_start:batch_start +
+                                      _MAX_GET_LOGS_BATCH_SIZE])
+                    if raw_event_logs is None:
+                        return None
+                    event_logs += [
+                        web3._utils.events.get_event_data(
+                            node_connection.codec, event_abi, raw_event_log)
+                        for raw_event_log in raw_event_logs
+                    ]
+            except Exception:
+                # Other failures (e.g. timeouts or block ranges
+                # exceeding a node's limit) may be transient, so batched
+                # requests are tried again with the next read
+                _logger.warning(
+                    'unable to read event logs with batched requests on '
+                    f'{self.get_blockchain_name()}, falling back to '
+                    'single requests', exc_info=True)
+                return None
+            results.append(event_logs)
+        if any(result != results[0] for result in results[1:]):
+            raise ResultsNotMatchingError(**{
+                str(index): result
+                for index, result in enumerate(results)
+            })
+        return results[0]
+
+    def __read_transaction_count(self,
+                                 node_connections: NodeConnections) -> int:
+        return node_connections.eth.get_transaction_count(
+            self.__address).get_maximum_result()
+
+    def __recover_signer_address(self,
+                                 message: eth_account.messages.SignableMessage,
+                                 signature: str) -> str:
+        message_hash = eth_account.messages._hash_eip191_message(message)
+        # Normalize v (27/28 or EIP-155 encoded) to 0/1
+        signature_bytes = \
+            eth_account._utils.signing.to_standard_signature_bytes(
+                hexbytes.HexBytes(signature))
+        public_key = _KEY_API.Signature(
+            signature_bytes).recover_public_key_from_msg_hash(message_hash)
+        return public_key.to_checksum_address()
+
     def __sort_validator_node_signatures(
             self, validator_node_signatures: dict[BlockchainAddress, str]) \
             -> tuple[list[BlockchainAddress], list[str]]:
@@ -544,25 +818,24 @@ class EthereumClient(BlockchainClient):
 
     def __submit_transfer_to_request(
             self, node_connections: NodeConnections, internal_transfer_id: int,
+            transaction_count: int,
             on_chain_request: _OnChainTransferToRequest,
             sorted_signer_addresses: list[BlockchainAddress],
-            sorted_signatures: list[str]) -> uuid.UUID:
-        contract_address = self._get_config()['hub']
+            sorted_signatures: list[bytes]) -> uuid.UUID:
+        config = self._get_config()
+        contract_address = config['hub']
         versioned_contract_abi = VERSIONED_CONTRACTS_ABI[
             ContractAbi.PANTOS_HUB]
         function_selector = _HUB_TRANSFER_TO_FUNCTION_SELECTOR
         function_args = (on_chain_request, sorted_signer_addresses,
                          sorted_signatures)
         gas = _HUB_TRANSFER_TO_GAS
-        min_adaptable_fee_per_gas = \
-            self._get_config()['min_adaptable_fee_per_gas']
-        max_total_fee_per_gas = self._get_config().get('max_total_fee_per_gas')
+        min_adaptable_fee_per_gas = config['min_adaptable_fee_per_gas']
+        max_total_fee_per_gas = config.get('max_total_fee_per_gas')
         amount = None
-        nonce = self.__get_nonce(node_connections, internal_transfer_id)
-        adaptable_fee_increase_factor = \
-            self._get_config()['adaptable_fee_increase_factor']
-        blocks_until_resubmission = \
-            self._get_config()['blocks_until_resubmission']
+        nonce = self.__get_nonce(internal_transfer_id, transaction_count)
+        adaptable_fee_increase_factor = config['adaptable_fee_increase_factor']
+        blocks_until_resubmission = config['blocks_until_resubmission']
         request = BlockchainUtilities.TransactionSubmissionStartRequest(
             contract_address, versioned_contract_abi, function_selector,
             function_args, gas, min_adaptable_fee_per_gas,
@@ -575,17 +848,32 @@ class EthereumClient(BlockchainClient):
             database_access.reset_transfer_nonce(internal_transfer_id)
             raise
 
+    def __to_loggable_value(self, value: typing.Any) -> typing.Any:
+        # Same representation as produced by web3.Web3.to_json, but
+        # without serializing and deserializing the value
+        if isinstance(value, collections.abc.Mapping):
+            return {
+                key: self.__to_loggable_value(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, (list, tuple)):
+            return [self.__to_loggable_value(item) for item in value]
+        if isinstance(value, (bytes, bytearray)):
+            return web3.Web3.to_hex(value)
+        return value
+
     def __verify_transfer_to_request(
-            self,
-            hub_contract: NodeConnections.Wrapper[web3.contract.Contract],
+            self, node_connections: NodeConnections,
             incoming_transfer: CrossChainTransfer,
             on_chain_request: _OnChainTransferToRequest,
             sorted_signer_addresses: list[BlockchainAddress],
-            sorted_signatures: list[str]) -> None:
+            sorted_signatures: list[bytes]) -> None:
         try:
-            hub_contract.functions.verifyTransferTo(
-                on_chain_request, sorted_signer_addresses,
-                sorted_signatures).call().get()
+            self.__call_contract_function(node_connections,
+                                          self._get_config()['hub'],
+                                          'verifyTransferTo', on_chain_request,
+                                          sorted_signer_addresses,
+                                          sorted_signatures)
         except web3.exceptions.ContractLogicError as error:
             if _NON_MATCHING_FORWARDER_ERROR in str(error):
                 raise self._create_non_matching_forwarder_error(
@@ -101,6 +101,10 @@ _VALIDATION_SCHEMA_BLOCKCHAIN = {
         'blocks_until_resubmission': {
             'type': 'integer',
             'required': True
+        },
+        'skip_pre_verify': {
+            'type': 'boolean',
+            'default': False
         }
     }
 }
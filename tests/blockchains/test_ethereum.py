@@ -1,12 +1,16 @@
 import atexit
+import dataclasses
+import json
 import pathlib
 import tempfile
 import unittest.mock
 import uuid
 
+import eth_abi
 import eth_account.messages
 import hexbytes
 import pytest
+import requests.exceptions
 import semantic_version  # type: ignore
 import web3
 import web3.exceptions
@@ -569,7 +573,10 @@ def test_get_error_class_correct(ethereum_client):
                   web3.Web3.WebsocketProvider('ws://127.0.0.1'), ''),
                  (web3.Web3.HTTPProvider('https://127.0.0.1/resource'),
                   web3.Web3.HTTPProvider('https://127.0.0.2/resource'),
-                  '127.0.0.1, 127.0.0.2')])
+                  '127.0.0.1, 127.0.0.2'),
+                 (web3.Web3.HTTPProvider('https://host.io?apikey=SECRET'),
+                  web3.Web3.HTTPProvider('https://host.io:8545#SECRET'),
+                  'host.io, host.io:8545')])
 def test_get_blockchain_node_domain_correct(provider, ethereum_client):
     w3_1 = web3.Web3(provider[0])
     w3_2 = web3.Web3(provider[1])
@@ -587,17 +594,21 @@ def test_get_own_address_correct(ethereum_client):
 
 
 @pytest.mark.parametrize('token_active', [True, False])
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
-def test_is_token_active_correct(mock_create_hub_contract, token_active,
-                                 ethereum_client):
-    mock_hub_contract = unittest.mock.MagicMock()
-    mock_get_token_record = unittest.mock.MagicMock()
-    mock_token_record = (token_active, 0)
-    mock_get_token_record.call().get.return_value = mock_token_record
-    mock_hub_contract.functions.getTokenRecord.return_value = \
-        mock_get_token_record
-    mock_create_hub_contract.return_value = mock_hub_contract
-    assert ethereum_client.is_token_active(_TOKEN_ADDRESS) is token_active
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'hub': _HUB_ADDRESS})
+def test_is_token_active_correct(mock_get_config, token_active,
+                                 ethereum_client, w3):
+    return_data = eth_abi.encode(['(bool,uint256)'], [(token_active, 0)])
+
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    return_value=return_data) as mock_call:
+        assert ethereum_client.is_token_active(_TOKEN_ADDRESS) is token_active
+
+    transaction = mock_call.call_args.args[0]
+    assert transaction['to'] == _HUB_ADDRESS
+    assert transaction['data'] == web3.Web3.to_hex(
+        web3.Web3.keccak(text='getTokenRecord(address)')[:4] +
+        eth_abi.encode(['address'], [_TOKEN_ADDRESS]))
 
 
 def test_is_token_active_error(ethereum_client):
@@ -605,12 +616,14 @@ def test_is_token_active_error(ethereum_client):
         ethereum_client.is_token_active(_TOKEN_ADDRESS)
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract',
-                            side_effect=ResultsNotMatchingError())
-def test_is_token_active_results_not_matching_error(mocked_create_hub_contract,
-                                                    ethereum_client):
-    with pytest.raises(ResultsNotMatchingError):
-        ethereum_client.is_token_active(_TOKEN_ADDRESS)
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'hub': _HUB_ADDRESS})
+def test_is_token_active_results_not_matching_error(mock_get_config,
+                                                    ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    side_effect=ResultsNotMatchingError):
+        with pytest.raises(ResultsNotMatchingError):
+            ethereum_client.is_token_active(_TOKEN_ADDRESS)
 
 
 @pytest.mark.parametrize(
@@ -618,6 +631,8 @@ def test_is_token_active_results_not_matching_error(mocked_create_hub_contract,
                       ('0x0000000000000000000000000000000000000000', False),
                       ('0x0f688208e2396bc18170dfd9b07f5f8d25e6491a', True),
                       ('0x0F688208E2396bC18170dFd9B07f5F8D25e6491a', True),
+                      ('0f688208e2396bc18170dfd9b07f5f8d25e6491a', True),
+                      ('0x0F688208E2396bC18170dFd9B07f5F8D25e6491g', False),
                       ('0x0F688208E2396bC18170dFd9B07f5F8D25e6491a1', False)])
 def test_is_valid_recipient_address_correct(address_valid, ethereum_client):
     assert (ethereum_client.is_valid_recipient_address(address_valid[0])
@@ -644,14 +659,15 @@ def test_is_valid_transaction_id_correct(transaction_id, ethereum_client):
 
 
 @pytest.mark.parametrize('nonce_valid', [True, False])
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
-def test_is_valid_validator_nonce_correct(mock_create_hub_contract,
-                                          nonce_valid, ethereum_client):
-    mock_create_hub_contract().caller().isValidValidatorNodeNonce().get.\
-        return_value = nonce_valid
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'hub': _HUB_ADDRESS})
+def test_is_valid_validator_nonce_correct(mock_get_config, nonce_valid,
+                                          ethereum_client, w3):
+    return_data = eth_abi.encode(['bool'], [nonce_valid])
 
-    assert (ethereum_client.is_valid_validator_nonce(_VALIDATOR_NONCE) ==
-            nonce_valid)
+    with unittest.mock.patch.object(w3.eth, 'call', return_value=return_data):
+        assert (ethereum_client.is_valid_validator_nonce(_VALIDATOR_NONCE) ==
+                nonce_valid)
 
 
 def test_is_valid_validator_nonce_error(ethereum_client):
@@ -661,14 +677,14 @@ def test_is_valid_validator_nonce_error(ethereum_client):
     assert exception_info.value.details['nonce'] == _VALIDATOR_NONCE
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'hub': _HUB_ADDRESS})
 def test_is_valid_validator_nonce_results_not_matching_error(
-        mock_create_hub_contract, ethereum_client):
-    mock_create_hub_contract().caller().isValidValidatorNodeNonce().get.\
-        side_effect = ResultsNotMatchingError()
-
-    with pytest.raises(ResultsNotMatchingError):
-        ethereum_client.is_valid_validator_nonce(_VALIDATOR_NONCE)
+        mock_get_config, ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    side_effect=ResultsNotMatchingError):
+        with pytest.raises(ResultsNotMatchingError):
+            ethereum_client.is_valid_validator_nonce(_VALIDATOR_NONCE)
 
 
 def test_is_equal_address(ethereum_client):
@@ -683,21 +699,20 @@ def test_is_equal_address(ethereum_client):
                          [(Blockchain.ETHEREUM, True),
                           (Blockchain.AVALANCHE, False),
                           (Blockchain.SOLANA, False), (Blockchain.CELO, True)])
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
-def test_read_external_token_address_correct(mock_create_hub_contract,
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'hub': _HUB_ADDRESS})
+def test_read_external_token_address_correct(mock_get_config,
                                              external_token_active,
-                                             ethereum_client):
-    mock_hub_contract = unittest.mock.MagicMock()
-    mock_get_external_token_record = unittest.mock.MagicMock()
+                                             ethereum_client, w3):
     mock_external_token_record = (external_token_active[1],
                                   'some_external_token_address')
-    mock_get_external_token_record.call().get.return_value = \
-        mock_external_token_record
-    mock_hub_contract.functions.getExternalTokenRecord.return_value = \
-        mock_get_external_token_record
-    mock_create_hub_contract.return_value = mock_hub_contract
-    external_token_address = ethereum_client.read_external_token_address(
-        _TOKEN_ADDRESS, external_token_active[0])
+    return_data = eth_abi.encode(['(bool,string)'],
+                                 [mock_external_token_record])
+
+    with unittest.mock.patch.object(w3.eth, 'call', return_value=return_data):
+        external_token_address = ethereum_client.read_external_token_address(
+            _TOKEN_ADDRESS, external_token_active[0])
+
     if external_token_active[1]:
         assert external_token_address == mock_external_token_record[1]
     else:
@@ -710,34 +725,39 @@ def test_read_external_token_address_error(ethereum_client):
                                                     Blockchain.BNB_CHAIN)
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract',
-                            side_effect=ResultsNotMatchingError())
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'hub': _HUB_ADDRESS})
 def test_read_external_token_address_results_not_matching_error(
-        mocked_create_hub_contract, ethereum_client):
-    with pytest.raises(ResultsNotMatchingError):
-        ethereum_client.read_external_token_address(_TOKEN_ADDRESS,
-                                                    Blockchain.BNB_CHAIN)
+        mock_get_config, ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    side_effect=ResultsNotMatchingError):
+        with pytest.raises(ResultsNotMatchingError):
+            ethereum_client.read_external_token_address(
+                _TOKEN_ADDRESS, Blockchain.BNB_CHAIN)
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_forwarder_contract')
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'forwarder': _FORWARDER_ADDRESS})
 def test_read_minimum_validator_node_signatures_correct(
-        mock_create_forwarder_contract, ethereum_client):
-    mock_create_forwarder_contract().caller().\
-        getMinimumValidatorNodeSignatures().get.return_value = \
-        _MINIMUM_VALIDATOR_NODE_SIGNATURES
+        mock_get_config, ethereum_client, w3):
+    return_data = eth_abi.encode(['uint256'],
+                                 [_MINIMUM_VALIDATOR_NODE_SIGNATURES])
 
-    minimum_signatures = \
-        ethereum_client.read_minimum_validator_node_signatures()
+    with unittest.mock.patch.object(w3.eth, 'call', return_value=return_data):
+        minimum_signatures = \
+            ethereum_client.read_minimum_validator_node_signatures()
 
     assert minimum_signatures == _MINIMUM_VALIDATOR_NODE_SIGNATURES
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_forwarder_contract',
-                            side_effect=ResultsNotMatchingError)
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'forwarder': _FORWARDER_ADDRESS})
 def test_read_minimum_validator_node_signatures_results_not_matching_error(
-        mock_create_forwarder_contract, ethereum_client):
-    with pytest.raises(ResultsNotMatchingError):
-        ethereum_client.read_minimum_validator_node_signatures()
+        mock_get_config, ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    side_effect=ResultsNotMatchingError):
+        with pytest.raises(ResultsNotMatchingError):
+            ethereum_client.read_minimum_validator_node_signatures()
 
 
 @unittest.mock.patch.object(EthereumClient, '_get_config',
@@ -783,6 +803,210 @@ def test_read_outgoing_transfers_from_block_correct(mock_get_config,
     assert response.to_block_number == latest_block_number
 
 
+def _to_raw_log(log):
+    raw_log = json.loads(web3.Web3.to_json(log))
+    for key in ['blockNumber', 'transactionIndex', 'logIndex']:
+        raw_log[key] = hex(raw_log[key])
+    return raw_log
+
+
+def _mock_get_logs_post_request(endpoint_uri, data, **kwargs):
+    def get_logs_result(filter_params):
+        assert filter_params['address'] == \
+            _OUTGOING_TRANSFERS[0].source_hub_address
+        assert filter_params['topics'] == [
+            _OUTGOING_TRANSFER_LOGS[0]['topics'][0].hex()
+        ]
+        from_block_number = int(filter_params['fromBlock'], 16)
+        to_block_number = int(filter_params['toBlock'], 16)
+        return [
+            _to_raw_log(log) for log in _OUTGOING_TRANSFER_LOGS
+            if log.blockNumber >= from_block_number
+            and log.blockNumber <= to_block_number
+        ]
+
+    # Responses are deliberately returned in reverse order
+    return json.dumps([{
+        'jsonrpc': '2.0',
+        'id': request['id'],
+        'result': get_logs_result(request['params'][0])
+    } for request in reversed(json.loads(data))]).encode()
+
+
+@pytest.mark.parametrize('from_block_number', [8608490, 8608492])
+@pytest.mark.parametrize('latest_block_number', [8608495, 8608496])
+@unittest.mock.patch('web3._utils.request.make_post_request')
+@unittest.mock.patch.object(EthereumClient, '_get_config')
+def test_read_outgoing_transfers_from_block_batched_correct(
+        mock_get_config, mock_make_post_request, from_block_number,
+        latest_block_number, ethereum_client):
+    mock_config = {
+        'hub': _OUTGOING_TRANSFERS[0].source_hub_address,
+        'outgoing_transfers_number_blocks': 2
+    }
+    mock_get_config.return_value = mock_config
+    http_w3 = web3.Web3(web3.Web3.HTTPProvider('https://127.0.0.1'))
+    http_node_connections = NodeConnections[web3.Web3]()
+    http_node_connections.add_node_connection(http_w3)
+    mock_make_post_request.side_effect = _mock_get_logs_post_request
+    with unittest.mock.patch.object(
+            ethereum_client, '_EthereumClient__create_node_connections',
+            return_value=http_node_connections):
+        with unittest.mock.patch.object(http_w3.eth, 'get_block_number',
+                                        return_value=latest_block_number):
+            response = ethereum_client.read_outgoing_transfers_from_block(
+                from_block_number)
+    mock_make_post_request.assert_called_once()
+    assert (response.outgoing_transfers == [
+        transfer for transfer in _OUTGOING_TRANSFERS
+        if transfer.source_block_number >= from_block_number
+        and transfer.source_block_number <= latest_block_number
+    ])
+    assert response.to_block_number == latest_block_number
+
+
+@unittest.mock.patch('web3._utils.request.make_post_request')
+@unittest.mock.patch.object(EthereumClient, '_get_config')
+def test_read_outgoing_transfers_from_block_batched_split_correct(
+        mock_get_config, mock_make_post_request, ethereum_client):
+    mock_get_config.return_value = {
+        'hub': _OUTGOING_TRANSFERS[0].source_hub_address,
+        'outgoing_transfers_number_blocks': 1
+    }
+    from_block_number = 9480600
+    latest_block_number = 9480720
+    http_w3 = web3.Web3(web3.Web3.HTTPProvider('https://127.0.0.1'))
+    http_node_connections = NodeConnections[web3.Web3]()
+    http_node_connections.add_node_connection(http_w3)
+    mock_make_post_request.side_effect = _mock_get_logs_post_request
+    with unittest.mock.patch.object(
+            ethereum_client, '_EthereumClient__create_node_connections',
+            return_value=http_node_connections):
+        with unittest.mock.patch.object(http_w3.eth, 'get_block_number',
+                                        return_value=latest_block_number):
+            response = ethereum_client.read_outgoing_transfers_from_block(
+                from_block_number)
+    assert [
+        len(json.loads(call.args[1]))
+        for call in mock_make_post_request.call_args_list
+    ] == [50, 50, 20]
+    assert response.outgoing_transfers == sorted(
+        _OUTGOING_TRANSFERS, key=lambda transfer: transfer.source_block_number)
+    assert response.to_block_number == latest_block_number
+
+
+# The batch is either rejected as a whole, its requests are each
+# rejected, or it fails with a timeout
+@pytest.mark.parametrize('batch_error, error_code, batch_requests_unsupported',
+                         [('batch', -32600, True), ('requests', -32600, True),
+                          ('requests', -32005, False),
+                          ('timeout', None, False)])
+@unittest.mock.patch('web3._utils.request.make_post_request')
+@unittest.mock.patch.object(EthereumClient, '_get_config')
+def test_read_outgoing_transfers_from_block_batched_fallback_correct(
+        mock_get_config, mock_make_post_request, batch_error, error_code,
+        batch_requests_unsupported, ethereum_client):
+    mock_get_config.return_value = {
+        'hub': _OUTGOING_TRANSFERS[0].source_hub_address,
+        'outgoing_transfers_number_blocks': 2
+    }
+    from_block_number = 9480690
+    latest_block_number = 9480710
+    http_w3 = web3.Web3(web3.Web3.HTTPProvider('https://127.0.0.1'))
+    http_node_connections = NodeConnections[web3.Web3]()
+    http_node_connections.add_node_connection(http_w3)
+
+    def mock_post_request(endpoint_uri, data, **kwargs):
+        if batch_error == 'timeout':
+            raise requests.exceptions.ReadTimeout
+        error = {'code': error_code, 'message': 'some error message'}
+        if batch_error == 'batch':
+            return json.dumps({
+                'jsonrpc': '2.0',
+                'id': None,
+                'error': error
+            }).encode()
+        return json.dumps([{
+            'jsonrpc': '2.0',
+            'id': request['id'],
+            'error': error
+        } for request in json.loads(data)]).encode()
+
+    def mock_get_logs(filter_params):
+        return [
+            log for log in _OUTGOING_TRANSFER_LOGS
+            if log.blockNumber >= filter_params['fromBlock']
+            and log.blockNumber <= filter_params['toBlock']
+        ]
+
+    mock_make_post_request.side_effect = mock_post_request
+    with unittest.mock.patch.object(
+            ethereum_client,
+            '_EthereumClient__batch_requests_unsupported_endpoint_uris',
+            set()):
+        with unittest.mock.patch.object(
+                ethereum_client, '_EthereumClient__create_node_connections',
+                return_value=http_node_connections):
+            with unittest.mock.patch.object(http_w3.eth, 'get_block_number',
+                                            return_value=latest_block_number):
+                with unittest.mock.patch.object(http_w3.eth, 'get_logs',
+                                                side_effect=mock_get_logs):
+                    responses = [
+                        ethereum_client.read_outgoing_transfers_from_block(
+                            from_block_number) for _ in range(2)
+                    ]
+    # A node not supporting batch requests is not sent a second batched
+    # request, while other errors are only a one-off fallback
+    assert mock_make_post_request.call_count == (
+        1 if batch_requests_unsupported else 2)
+    for response in responses:
+        assert response.outgoing_transfers == sorted(
+            _OUTGOING_TRANSFERS,
+            key=lambda transfer: transfer.source_block_number)
+        assert response.to_block_number == latest_block_number
+
+
+@unittest.mock.patch('web3._utils.request.make_post_request')
+@unittest.mock.patch.object(EthereumClient, '_get_config')
+def test_read_outgoing_transfers_from_block_batched_results_not_matching_error(
+        mock_get_config, mock_make_post_request, ethereum_client):
+    mock_get_config.return_value = {
+        'hub': _OUTGOING_TRANSFERS[0].source_hub_address,
+        'outgoing_transfers_number_blocks': 2
+    }
+    from_block_number = 9480690
+    latest_block_number = 9480710
+    http_w3 = web3.Web3(web3.Web3.HTTPProvider('https://127.0.0.1'))
+    other_http_w3 = web3.Web3(web3.Web3.HTTPProvider('https://127.0.0.2'))
+    http_node_connections = NodeConnections[web3.Web3]()
+    http_node_connections.add_node_connection(http_w3)
+    http_node_connections.add_node_connection(other_http_w3)
+
+    def mock_post_request(endpoint_uri, data, **kwargs):
+        raw_response = _mock_get_logs_post_request(endpoint_uri, data,
+                                                   **kwargs)
+        if endpoint_uri == 'https://127.0.0.1':
+            return raw_response
+        # The second node does not return any event logs
+        return json.dumps([
+            dict(response, result=[]) for response in json.loads(raw_response)
+        ]).encode()
+
+    mock_make_post_request.side_effect = mock_post_request
+    with unittest.mock.patch.object(
+            ethereum_client, '_EthereumClient__create_node_connections',
+            return_value=http_node_connections):
+        with unittest.mock.patch.object(
+                http_w3.eth, 'get_block_number',
+                return_value=latest_block_number), \
+                unittest.mock.patch.object(
+                    other_http_w3.eth, 'get_block_number',
+                    return_value=latest_block_number):
+            with pytest.raises(ResultsNotMatchingError):
+                ethereum_client.read_outgoing_transfers_from_block(
+                    from_block_number)
+
+
 def test_read_outgoing_transfers_from_block_error(ethereum_client, w3):
     from_block_number = 1000
     with unittest.mock.patch.object(w3.eth, 'get_block_number',
@@ -815,6 +1039,17 @@ def test_read_outgoing_transfers_in_transaction_correct(ethereum_client, w3):
             transaction_id, hub_address) == [_OUTGOING_TRANSFERS[0]])
 
 
+def test_read_outgoing_transfers_in_transaction_other_hub_correct(
+        ethereum_client, w3):
+    transaction_id = _OUTGOING_TRANSFER_TRANSACTION_RECEIPT[
+        'transactionHash'].hex()
+    with unittest.mock.patch.object(
+            w3.eth, 'get_transaction_receipt',
+            return_value=_OUTGOING_TRANSFER_TRANSACTION_RECEIPT):
+        assert ethereum_client.read_outgoing_transfers_in_transaction(
+            transaction_id, _HUB_ADDRESS) == []
+
+
 def test_read_outgoing_transfers_in_transaction_error(ethereum_client):
     hub_address = _OUTGOING_TRANSFERS[0].source_hub_address
     with pytest.raises(EthereumClientError) as exception_info:
@@ -835,16 +1070,15 @@ def test_read_outgoing_transfers_in_transaction_results_not_matching_error(
 
 
 @pytest.mark.parametrize('token_decimals', [8, 18])
-@unittest.mock.patch.object(EthereumClient, '_create_token_contract')
-def test_read_token_decimals_correct(mock_create_token_contract,
-                                     token_decimals, ethereum_client):
-    mock_token_contract = unittest.mock.MagicMock()
-    mock_decimals = unittest.mock.MagicMock()
-    mock_decimals.call().get.return_value = token_decimals
-    mock_token_contract.functions.decimals.return_value = mock_decimals
-    mock_create_token_contract.return_value = mock_token_contract
-    assert (
-        ethereum_client.read_token_decimals(_TOKEN_ADDRESS) == token_decimals)
+def test_read_token_decimals_correct(token_decimals, ethereum_client, w3):
+    return_data = eth_abi.encode(['uint8'], [token_decimals])
+
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    return_value=return_data) as mock_call:
+        assert (ethereum_client.read_token_decimals(_TOKEN_ADDRESS) ==
+                token_decimals)
+
+    assert mock_call.call_args.args[0]['to'] == _TOKEN_ADDRESS
 
 
 def test_read_token_decimals_error(ethereum_client):
@@ -853,12 +1087,11 @@ def test_read_token_decimals_error(ethereum_client):
     assert exception_info.value.details['token_address'] == _TOKEN_ADDRESS
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_token_contract',
-                            side_effect=ResultsNotMatchingError())
-def test_read_token_decimals_results_not_matching_error(
-        mocked_create_token_contract, ethereum_client):
-    with pytest.raises(ResultsNotMatchingError):
-        ethereum_client.read_token_decimals(_TOKEN_ADDRESS)
+def test_read_token_decimals_results_not_matching_error(ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    side_effect=ResultsNotMatchingError):
+        with pytest.raises(ResultsNotMatchingError):
+            ethereum_client.read_token_decimals(_TOKEN_ADDRESS)
 
 
 @pytest.mark.parametrize('read_destination_transfer_id', [True, False])
@@ -890,6 +1123,26 @@ def test_read_transfer_to_transaction_data_correct(
             data_response.destination_transfer_id == destination_transfer_id)
 
 
+@unittest.mock.patch('pantos.validatornode.blockchains.ethereum._logger')
+@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
+def test_read_transfer_to_transaction_data_receipt_logged_correct(
+        mock_create_hub_contract, mock_logger, ethereum_client, w3):
+    transaction_id = _INCOMING_TRANSFER_TRANSACTION_RECEIPT[
+        'transactionHash'].hex()
+    mock_logger.isEnabledFor.return_value = True
+
+    with unittest.mock.patch.object(
+            w3.eth, 'get_transaction_receipt',
+            return_value=_INCOMING_TRANSFER_TRANSACTION_RECEIPT):
+        ethereum_client._read_transfer_to_transaction_data(
+            transaction_id, False)
+
+    # The logged receipt must be the same as its former JSON round trip
+    mock_logger.info.assert_called_once_with(
+        'transferTo transaction receipt', extra=json.loads(
+            web3.Web3.to_json(_INCOMING_TRANSFER_TRANSACTION_RECEIPT)))
+
+
 @pytest.mark.parametrize('errors',
                          [(ResultsNotMatchingError, ResultsNotMatchingError),
                           (Exception, EthereumClientError)])
@@ -904,23 +1157,26 @@ def test_read_transfer_to_transaction_data_error(errors, ethereum_client, w3):
                 transaction_id, True)
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_forwarder_contract')
-def test_read_validator_node_addresses_correct(mock_create_forwarder_contract,
-                                               ethereum_client):
-    mock_create_forwarder_contract().caller().\
-        getValidatorNodes().get.return_value = _VALIDATOR_NODE_ADDRESSES
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'forwarder': _FORWARDER_ADDRESS})
+def test_read_validator_node_addresses_correct(mock_get_config,
+                                               ethereum_client, w3):
+    return_data = eth_abi.encode(['address[]'], [_VALIDATOR_NODE_ADDRESSES])
 
-    read_addresses = ethereum_client.read_validator_node_addresses()
+    with unittest.mock.patch.object(w3.eth, 'call', return_value=return_data):
+        read_addresses = ethereum_client.read_validator_node_addresses()
 
     assert read_addresses == _VALIDATOR_NODE_ADDRESSES
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_forwarder_contract',
-                            side_effect=ResultsNotMatchingError)
+@unittest.mock.patch.object(EthereumClient, '_get_config',
+                            return_value={'forwarder': _FORWARDER_ADDRESS})
 def test_read_validator_node_addresses_results_not_matching_error(
-        mock_create_forwarder_contract, ethereum_client):
-    with pytest.raises(ResultsNotMatchingError):
-        ethereum_client.read_validator_node_addresses()
+        mock_get_config, ethereum_client, w3):
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    side_effect=ResultsNotMatchingError):
+        with pytest.raises(ResultsNotMatchingError):
+            ethereum_client.read_validator_node_addresses()
 
 
 @unittest.mock.patch.object(EthereumClient, '_get_config',
@@ -931,8 +1187,10 @@ def test_read_validator_node_addresses_other_error(mock_get_config,
         ethereum_client.read_validator_node_addresses()
 
 
+# v is either 0/1, 27/28, or EIP-155 encoded (for chain ID 1)
+@pytest.mark.parametrize('v_offset', [0, 27, 37])
 @unittest.mock.patch.object(EthereumClient, '_get_config')
-def test_recover_transfer_to_signer_address_correct(mock_get_config,
+def test_recover_transfer_to_signer_address_correct(mock_get_config, v_offset,
                                                     incoming_transfer_message,
                                                     ethereum_client):
     mock_config = {
@@ -943,6 +1201,8 @@ def test_recover_transfer_to_signer_address_correct(mock_get_config,
     mock_get_config.return_value = mock_config
     signed_message = web3.Account.sign_message(incoming_transfer_message,
                                                private_key=_PRIVATE_KEY)
+    signature = hexbytes.HexBytes(signed_message.signature[:-1] +
+                                  bytes([signed_message.v - 27 + v_offset]))
     request = BlockchainClient.TransferToSignerAddressRecoveryRequest(
         source_blockchain=_INCOMING_TRANSFER.source_blockchain,
         source_transaction_id=_INCOMING_TRANSFER.source_transaction_id,
@@ -952,7 +1212,7 @@ def test_recover_transfer_to_signer_address_correct(mock_get_config,
         source_token_address=_INCOMING_TRANSFER.source_token_address,
         destination_token_address=_INCOMING_TRANSFER.destination_token_address,
         amount=_INCOMING_TRANSFER.amount, validator_nonce=_VALIDATOR_NONCE,
-        signature=signed_message.signature)
+        signature=signature)
 
     recovered_signer_address = \
         ethereum_client.recover_transfer_to_signer_address(request)
@@ -985,6 +1245,32 @@ def test_recover_transfer_to_signer_address_error(mock_get_config,
         ethereum_client.recover_transfer_to_signer_address(request)
 
 
+@unittest.mock.patch.object(
+    EthereumClient, '_get_config', return_value={
+        'hub': _HUB_ADDRESS,
+        'forwarder': _FORWARDER_ADDRESS,
+        'pan_token': _INCOMING_TRANSFER.destination_token_address
+    })
+def test_recover_transfer_to_signer_address_invalid_address_error(
+        mock_get_config, incoming_transfer_message, ethereum_client):
+    signed_message = web3.Account.sign_message(incoming_transfer_message,
+                                               private_key=_PRIVATE_KEY)
+    request = BlockchainClient.TransferToSignerAddressRecoveryRequest(
+        source_blockchain=_INCOMING_TRANSFER.source_blockchain,
+        source_transaction_id=_INCOMING_TRANSFER.source_transaction_id,
+        source_transfer_id=_INCOMING_TRANSFER.source_transfer_id,
+        sender_address=_INCOMING_TRANSFER.sender_address,
+        recipient_address=BlockchainAddress(
+            _INCOMING_TRANSFER.recipient_address.lower()),
+        source_token_address=_INCOMING_TRANSFER.source_token_address,
+        destination_token_address=_INCOMING_TRANSFER.destination_token_address,
+        amount=_INCOMING_TRANSFER.amount, validator_nonce=_VALIDATOR_NONCE,
+        signature=signed_message.signature)
+
+    with pytest.raises(web3.exceptions.InvalidAddress):
+        ethereum_client.recover_transfer_to_signer_address(request)
+
+
 @unittest.mock.patch.object(
     EthereumClient, '_get_config', return_value={
         'hub': _HUB_ADDRESS,
@@ -1020,6 +1306,38 @@ def test_sign_transfer_to_message_destination_blockchain_error(
     assert exception_info.value.details['request'] == request
 
 
+# All-lowercase, all-uppercase, and mixed-case addresses with an
+# invalid checksum (a single letter with a changed case)
+@pytest.mark.parametrize('to_invalid_address', [
+    lambda address: address.lower(),
+    lambda address: '0x' + address[2:].upper(),
+    lambda address: address[:9] + address[9].upper() + address[10:]
+])
+@unittest.mock.patch.object(
+    EthereumClient, '_get_config', return_value={
+        'hub': _HUB_ADDRESS,
+        'forwarder': _FORWARDER_ADDRESS,
+        'pan_token': _INCOMING_TRANSFER.destination_token_address
+    })
+def test_sign_transfer_to_message_invalid_checksum_error(
+        mock_get_config, to_invalid_address, ethereum_client):
+    recipient_address = _INCOMING_TRANSFER.recipient_address
+    invalid_recipient_address = BlockchainAddress(
+        to_invalid_address(recipient_address))
+    assert invalid_recipient_address != recipient_address
+    incoming_transfer = dataclasses.replace(
+        _INCOMING_TRANSFER, recipient_address=invalid_recipient_address)
+
+    request = BlockchainClient.TransferToMessageSignRequest(
+        incoming_transfer=incoming_transfer, validator_nonce=_VALIDATOR_NONCE,
+        destination_hub_address=_HUB_ADDRESS,
+        destination_forwarder_address=_FORWARDER_ADDRESS)
+    with pytest.raises(EthereumClientError) as exception_info:
+        ethereum_client.sign_transfer_to_message(request)
+
+    assert exception_info.value.details['request'] == request
+
+
 @unittest.mock.patch('web3.Account.sign_message', side_effect=Exception)
 @unittest.mock.patch.object(
     EthereumClient, '_get_config', return_value={
@@ -1074,7 +1392,8 @@ def test_start_transfer_to_submission_correct(mock_get_config,
         'min_adaptable_fee_per_gas': 1000000000,
         'max_total_fee_per_gas': 50000000000,
         'adaptable_fee_increase_factor': 1.101,
-        'blocks_until_resubmission': 10
+        'blocks_until_resubmission': 10,
+        'skip_pre_verify': False
     }
     mock_get_config.return_value = mock_config
     internal_transfer_id = 26849
@@ -1103,18 +1422,65 @@ def test_start_transfer_to_submission_correct(mock_get_config,
                                     mock_start_transaction_submission):
         with unittest.mock.patch.object(w3.eth, 'get_transaction_count',
                                         return_value=blockchain_nonce):
-            response = ethereum_client.start_transfer_to_submission(request)
+            with unittest.mock.patch.object(w3.eth, 'call',
+                                            return_value=b'') as mock_call:
+                response = ethereum_client.start_transfer_to_submission(
+                    request)
 
     assert response == internal_transaction_id
+    verify_transaction = mock_call.call_args.args[0]
+    assert verify_transaction['to'] == mock_config['hub']
+    assert verify_transaction['data'].startswith(
+        web3.Web3.keccak(
+            text='verifyTransferTo((uint256,uint256,string,string,address,'
+            'string,address,uint256,uint256),address[],bytes[])')[:4].hex())
     mock_database_access.update_transfer_nonce.assert_called_once_with(
         internal_transfer_id, Blockchain.ETHEREUM, blockchain_nonce)
     mock_start_transaction_submission.assert_called_once()
+    submission_request = mock_start_transaction_submission.call_args.args[0]
+    assert all(
+        isinstance(signature, bytes)
+        for signature in submission_request.function_args[2])
+
+
+@unittest.mock.patch(
+    'pantos.validatornode.blockchains.ethereum.database_access')
+@unittest.mock.patch.object(EthereumClient, '_get_config')
+def test_start_transfer_to_submission_skip_pre_verify_correct(
+        mock_get_config, mock_database_access, ethereum_client, w3):
+    mock_get_config.return_value = {
+        'hub': _HUB_ADDRESS,
+        'min_adaptable_fee_per_gas': 1000000000,
+        'adaptable_fee_increase_factor': 1.101,
+        'blocks_until_resubmission': 10,
+        'skip_pre_verify': True
+    }
+    internal_transfer_id = 83751
+    internal_transaction_id = uuid.uuid4()
+    mock_database_access.read_transfer_nonce.return_value = 0
+
+    request = BlockchainClient.TransferToSubmissionStartRequest(
+        internal_transfer_id, _INCOMING_TRANSFER, _VALIDATOR_NONCE,
+        dict(zip(_VALIDATOR_NODE_ADDRESSES, _VALIDATOR_NODE_SIGNATURES)))
+    with unittest.mock.patch.object(ethereum_client.get_utilities(),
+                                    'start_transaction_submission',
+                                    return_value=internal_transaction_id):
+        with unittest.mock.patch.object(w3.eth, 'call') as mock_call:
+            with unittest.mock.patch.object(
+                    ethereum_client._EthereumClient__executor,
+                    'submit') as mock_submit:
+                response = ethereum_client.start_transfer_to_submission(
+                    request)
+
+    assert response == internal_transaction_id
+    mock_call.assert_not_called()
+    # The transaction count is read directly without the verification
+    mock_submit.assert_not_called()
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
 @unittest.mock.patch.object(EthereumClient, '_get_config')
 def test_start_transfer_to_submission_node_communication_error(
-        mock_get_config, mock_create_hub_contract, ethereum_client, w3):
+        mock_get_config, ethereum_client, w3):
     internal_transfer_id = 24526
     error_message = 'some blockchain node error message'
 
@@ -1123,8 +1489,9 @@ def test_start_transfer_to_submission_node_communication_error(
         dict(zip(_VALIDATOR_NODE_ADDRESSES, _VALIDATOR_NODE_SIGNATURES)))
     with unittest.mock.patch.object(w3.eth, 'get_transaction_count',
                                     side_effect=Exception(error_message)):
-        with pytest.raises(EthereumClientError) as exception_info:
-            ethereum_client.start_transfer_to_submission(request)
+        with unittest.mock.patch.object(w3.eth, 'call', return_value=b''):
+            with pytest.raises(EthereumClientError) as exception_info:
+                ethereum_client.start_transfer_to_submission(request)
 
     assert str(exception_info.value.__context__) == error_message
     assert exception_info.value.details['request'] == request
@@ -1150,11 +1517,10 @@ def test_start_transfer_to_submission_destination_blockchain_error(
     [TransactionNonceTooLowError, TransactionUnderpricedError])
 @unittest.mock.patch(
     'pantos.validatornode.blockchains.ethereum.database_access')
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
 @unittest.mock.patch.object(EthereumClient, '_get_config')
 def test_start_transfer_to_submission_transaction_error(
-        mock_get_config, mock_create_hub_contract, mock_database_access,
-        transaction_error, ethereum_client):
+        mock_get_config, mock_database_access, transaction_error,
+        ethereum_client, w3):
     internal_transfer_id = 19484
 
     request = BlockchainClient.TransferToSubmissionStartRequest(
@@ -1163,8 +1529,9 @@ def test_start_transfer_to_submission_transaction_error(
     with unittest.mock.patch.object(ethereum_client.get_utilities(),
                                     'start_transaction_submission',
                                     side_effect=transaction_error):
-        with pytest.raises(EthereumClientError) as exception_info:
-            ethereum_client.start_transfer_to_submission(request)
+        with unittest.mock.patch.object(w3.eth, 'call', return_value=b''):
+            with pytest.raises(EthereumClientError) as exception_info:
+                ethereum_client.start_transfer_to_submission(request)
 
     assert exception_info.value.details['request'] == request
     mock_database_access.reset_transfer_nonce.assert_called_once_with(
@@ -1178,35 +1545,38 @@ def test_start_transfer_to_submission_transaction_error(
      ('PantosHub: Forwarder of Hub and transferred token must match',
       NonMatchingForwarderError),
      ('some unknown error message', EthereumClientError)])
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract')
-@unittest.mock.patch.object(EthereumClient, '_get_config')
+@unittest.mock.patch.object(
+    EthereumClient, '_get_config', return_value={
+        'hub': _HUB_ADDRESS,
+        'skip_pre_verify': False
+    })
 def test_start_transfer_to_submission_verify_transfer_error(
-        mock_get_config, mock_create_hub_contract, verify_transfer_to_error,
-        ethereum_client):
+        mock_get_config, verify_transfer_to_error, ethereum_client, w3):
     internal_transfer_id = 91734
-    mock_hub_contract = unittest.mock.MagicMock()
-    mock_verify_transfer_to = unittest.mock.MagicMock()
-    mock_verify_transfer_to.call.side_effect = \
-        web3.exceptions.ContractLogicError(verify_transfer_to_error[0])
-    mock_hub_contract.functions.verifyTransferTo.return_value = \
-        mock_verify_transfer_to
-    mock_create_hub_contract.return_value = mock_hub_contract
 
     request = BlockchainClient.TransferToSubmissionStartRequest(
         internal_transfer_id, _INCOMING_TRANSFER, _VALIDATOR_NONCE,
         dict(zip(_VALIDATOR_NODE_ADDRESSES, _VALIDATOR_NODE_SIGNATURES)))
-    with pytest.raises(verify_transfer_to_error[1]):
-        ethereum_client.start_transfer_to_submission(request)
+    with unittest.mock.patch.object(
+            w3.eth, 'call', side_effect=web3.exceptions.ContractLogicError(
+                verify_transfer_to_error[0])):
+        with pytest.raises(verify_transfer_to_error[1]):
+            ethereum_client.start_transfer_to_submission(request)
 
 
-@unittest.mock.patch.object(EthereumClient, '_create_hub_contract',
-                            side_effect=ResultsNotMatchingError)
+@unittest.mock.patch.object(
+    EthereumClient, '_get_config', return_value={
+        'hub': _HUB_ADDRESS,
+        'skip_pre_verify': False
+    })
 def test_start_transfer_to_submission_results_not_matching_error(
-        mock_create_hub_contract, ethereum_client):
+        mock_get_config, ethereum_client, w3):
     internal_transfer_id = 273695
 
     request = BlockchainClient.TransferToSubmissionStartRequest(
         internal_transfer_id, _INCOMING_TRANSFER, _VALIDATOR_NONCE,
         dict(zip(_VALIDATOR_NODE_ADDRESSES, _VALIDATOR_NODE_SIGNATURES)))
-    with pytest.raises(ResultsNotMatchingError):
-        ethereum_client.start_transfer_to_submission(request)
+    with unittest.mock.patch.object(w3.eth, 'call',
+                                    side_effect=ResultsNotMatchingError):
+        with pytest.raises(ResultsNotMatchingError):
+            ethereum_client.start_transfer_to_submission(request)